@@ -1,4 +1,5 @@
 import logging
+import os
 from argparse import Namespace
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -6,11 +7,6 @@ from typing import List, Mapping, Optional
 
 from .constants import DEFAULT_DELAY
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
-
 CONFIG_SECTION_NAME = "pytest-watcher"
 CLI_FIELDS = {
     "now",
@@ -77,17 +73,30 @@ class Config:
 def find_config(cwd: Path) -> Optional[Path]:
     filename = "pyproject.toml"
 
-    for path in (cwd, *cwd.parents):
-        config_path = path.joinpath(filename)
+    # Walk up with plain strings: one stat per directory and no Path
+    # objects until a config file is actually found
+    directory = os.fspath(cwd)
+    while True:
+        config_path = os.path.join(directory, filename)
 
-        if config_path.exists():
+        if os.path.isfile(config_path):
             logger.debug("Found configuration file at %s", config_path)
-            return config_path
+            return Path(config_path)
 
-    return None
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
 
 
 def parse_config(path: Path) -> Mapping:
+    # Imported lazily: startup paths that never read a config file (e.g.
+    # ``--help`` or no pyproject.toml found) don't pay for the TOML parser
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+
     with open(path, "rb") as f:
         try:
             data = tomllib.load(f)
@@ -1,18 +1,160 @@
 from __future__ import annotations
 
+import fnmatch
+import heapq
 import logging
 import os
-from pathlib import Path
-from typing import List, Sequence, Tuple
+import re
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Default glob patterns used to discover test files
 TEST_FILE_PATTERNS = ("test_*.py", "*_test.py")
 
+# Directories never searched for test files: VCS metadata, virtualenvs,
+# vendored packages and tool caches
+_SKIP_DIRS = frozenset(
+    (
+        ".git",
+        ".hg",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    )
+)
 
-def fuzzy_match(query: str, text: str) -> Tuple[bool, int]:
-    """Return (matched, score) for *query* against *text*.
+
+_BOUNDARY_CHARS = frozenset((os.sep, "/", "_"))
+
+
+def _boundary_mask(text_lower: str) -> int:
+    """Return a bitmap with bit *i* set when ``text_lower[i]`` starts a word.
+
+    A character starts a word when it is the first one, or follows a path
+    separator or ``_``.
+    """
+    mask = 1 if text_lower else 0
+    for i, ch in enumerate(text_lower[:-1], 1):
+        if ch in _BOUNDARY_CHARS:
+            mask |= 1 << i
+    return mask
+
+
+def _char_masks(text_lower: str) -> Dict[str, int]:
+    """Map each character of *text_lower* to a bitmap of its positions."""
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(text_lower):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+class Candidates(List[str]):
+    """A list of paths with the per-path data used by :func:`fuzzy_filter`.
+
+    Lowercased paths, word-boundary bitmaps and per-character position
+    bitmaps are computed once on construction, so filtering on every
+    keystroke only does the scoring pass.
+    Treat instances as read-only: the precomputed columns are not updated
+    when the list is mutated.
+    """
+
+    lowers: List[str]
+    boundary_masks: List[int]
+    char_masks: List[Dict[str, int]]
+
+    def __init__(
+        self, paths: Iterable[str] = (), reuse: Optional[Candidates] = None
+    ) -> None:
+        """Precompute the data for *paths*, copying it from *reuse* (e.g. an
+        earlier scan of the same tree) for paths that appear there."""
+        super().__init__(paths)
+        known: Dict[str, Tuple[str, int, Dict[str, int]]] = {}
+        if reuse:
+            known = dict(
+                zip(reuse, zip(reuse.lowers, reuse.boundary_masks, reuse.char_masks))
+            )
+        self.lowers = []
+        self.boundary_masks = []
+        self.char_masks = []
+        for path in self:
+            data = known.get(path)
+            if data is None:
+                lower = path.lower()
+                data = (lower, _boundary_mask(lower), _char_masks(lower))
+            self.lowers.append(data[0])
+            self.boundary_masks.append(data[1])
+            self.char_masks.append(data[2])
+
+    def subset(self, indices: Iterable[int]) -> Candidates:
+        """Return the entries at *indices*, reusing their precomputed data."""
+        indices = list(indices)
+        sub = Candidates.__new__(Candidates)
+        list.__init__(sub, [self[i] for i in indices])
+        sub.lowers = [self.lowers[i] for i in indices]
+        sub.boundary_masks = [self.boundary_masks[i] for i in indices]
+        sub.char_masks = [self.char_masks[i] for i in indices]
+        return sub
+
+
+def _is_subsequence(query_lower: str, text_lower: str) -> bool:
+    """Cheap match test: do the characters of *query_lower* occur in order?"""
+    start = 0
+    for ch in query_lower:
+        start = text_lower.find(ch, start) + 1
+        if not start:
+            return False
+    return True
+
+
+# Returned by _score when the query does not match; real scores are >= 0
+_NO_MATCH = -1
+
+
+def _score(
+    query_lower: str, char_masks: Dict[str, int], boundary_mask: int, length: int
+) -> int:
+    """Scoring pass of :func:`fuzzy_match` over precomputed bitmaps.
+
+    For each query character, the positions still reachable after the
+    previous match are ``char_masks[ch] >> start``; the lowest set bit is the
+    next match, so each step is a handful of integer operations regardless
+    of the text length.  Returns :data:`_NO_MATCH` when some character is
+    not reachable.
+    """
+    score = 0
+    prev_match_idx = -2  # used to detect consecutive matches
+    start = 0  # where to resume searching in the text
+
+    for ch in query_lower:
+        reachable = char_masks.get(ch, 0) >> start
+        if not reachable:
+            return _NO_MATCH
+        ti = start + (reachable & -reachable).bit_length() - 1
+        # consecutive bonus
+        if ti == prev_match_idx + 1:
+            score += 3
+        # word-boundary bonus (start, after / or _)
+        if (boundary_mask >> ti) & 1:
+            score += 2
+        prev_match_idx = ti
+        start = ti + 1
+
+    # shorter tail bonus
+    score += max(0, length - prev_match_idx)
+
+    return score
+
+
+def fuzzy_match(query: str, text: str) -> int:
+    """Return the score of *query* against *text*, negative for no match.
 
     The algorithm checks whether every character of *query* appears in *text*
     in order (case-insensitive).  The score rewards:
@@ -22,69 +164,142 @@ def fuzzy_match(query: str, text: str) -> Tuple[bool, int]:
 
     A higher score means a better match.
     """
-    query_lower = query.lower()
     text_lower = text.lower()
+    return _score(
+        query.lower(),
+        _char_masks(text_lower),
+        _boundary_mask(text_lower),
+        len(text_lower),
+    )
 
-    qi = 0  # index into query
-    score = 0
-    prev_match_idx = -2  # used to detect consecutive matches
-
-    for ti, ch in enumerate(text_lower):
-        if qi < len(query_lower) and ch == query_lower[qi]:
-            # consecutive bonus
-            if ti == prev_match_idx + 1:
-                score += 3
-            # word-boundary bonus (start, after / or _)
-            if ti == 0 or text_lower[ti - 1] in (os.sep, "/", "_"):
-                score += 2
-            prev_match_idx = ti
-            qi += 1
 
-    matched = qi == len(query_lower)
-    if matched:
-        # shorter tail bonus
-        score += max(0, len(text_lower) - prev_match_idx)
-
-    return matched, score
+def _is_ignored(path: str, ignore_patterns: Sequence[str]) -> bool:
+    """Match *path* the way the watcher matches its ``ignore_patterns``."""
+    pure = PurePath(path)
+    return any(pure.match(p) for p in ignore_patterns)
 
 
 def find_test_files(
     root: Path,
     patterns: Sequence[str] = TEST_FILE_PATTERNS,
-) -> List[str]:
-    """Walk *root* and return relative paths of files matching *patterns*."""
+    ignore_patterns: Sequence[str] = (),
+    reuse: Optional[Candidates] = None,
+) -> Candidates:
+    """Walk *root* and return relative paths of files matching *patterns*.
+
+    The tree is traversed once with :func:`os.scandir`, reusing the type
+    information of each directory entry instead of stat-ing every path.
+    Directories in :data:`_SKIP_DIRS` are not descended into, and neither
+    are files or directories matching one of *ignore_patterns*.
+
+    Pass the result of a previous call as *reuse* to skip recomputing the
+    fuzzy-matching data of files that are still there.
+    """
+    if not patterns:
+        return Candidates()
+
+    # One alternation instead of a regex per pattern: a single match call
+    # tests every pattern against each file name
+    matches_pattern = re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    ).match
     results: List[str] = []
-    for pattern in patterns:
-        for path in root.rglob(pattern):
-            if path.is_file():
-                try:
-                    rel = str(path.relative_to(root))
-                except ValueError:
-                    rel = str(path)
-                results.append(rel)
-    # deduplicate while preserving order
-    seen: set[str] = set()
-    deduped: List[str] = []
-    for r in results:
-        if r not in seen:
-            seen.add(r)
-            deduped.append(r)
-    return sorted(deduped)
+
+    # (directory to scan, its path relative to root with a trailing separator);
+    # building relative paths by prefix avoids os.path.relpath for every hit
+    pending = [(os.fspath(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as exc:
+            logger.debug("Skipping unreadable directory: %s", exc)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS and not (
+                        ignore_patterns and _is_ignored(entry.path, ignore_patterns)
+                    ):
+                        pending.append((entry.path, prefix + entry.name + os.sep))
+                    continue
+                name = os.path.normcase(entry.name)
+                if (
+                    matches_pattern(name)
+                    and entry.is_file()
+                    and not (
+                        ignore_patterns and _is_ignored(entry.path, ignore_patterns)
+                    )
+                ):
+                    results.append(prefix + entry.name)
+
+    return Candidates(sorted(results), reuse=reuse)
 
 
 def fuzzy_filter(
     query: str,
     candidates: Sequence[str],
+    limit: Optional[int] = None,
 ) -> List[str]:
-    """Return *candidates* that fuzzy-match *query*, sorted best-first."""
+    """Return *candidates* that fuzzy-match *query*, sorted best-first.
+
+    Equally scored candidates are ordered by path, so filtering a previous
+    result list yields the same order as filtering the full list.
+
+    With a *limit*, only the best *limit* matches are ranked; the remaining
+    matches follow them in input order.  Matches that provably cannot reach
+    the top *limit* are not scored at all.  *limit* must be positive.
+
+    Pass a :class:`Candidates` instance to reuse its precomputed data; the
+    result is then itself a :class:`Candidates` (also for an empty query),
+    so it can be filtered further without recomputing anything.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be positive, got {limit}")
+
     if not query:
+        if isinstance(candidates, Candidates):
+            return candidates.subset(range(len(candidates)))
         return list(candidates)
 
-    scored: List[Tuple[int, str]] = []
-    for c in candidates:
-        matched, score = fuzzy_match(query, c)
-        if matched:
-            scored.append((score, c))
+    if not isinstance(candidates, Candidates):
+        candidates = Candidates(candidates)
+
+    query_lower = query.lower()
+    boundary_masks = candidates.boundary_masks
+    char_masks = candidates.char_masks
+    matches: List[int] = []
+    scored: List[Tuple[int, int]] = []
+    best: List[int] = []  # min-heap of the top `limit` scores so far
+    # Highest score a match can get, minus the candidate length: every
+    # character scores at most +5 (+2 for the first) and the tail bonus is
+    # at most ``len(text) - len(query) + 1``
+    max_bonus = 4 * len(query_lower) - 2
+
+    for i, text_lower in enumerate(candidates.lowers):
+        # Most candidates don't match; prune them before doing any scoring
+        if not _is_subsequence(query_lower, text_lower):
+            continue
+        if limit is not None:
+            matches.append(i)
+            if len(best) == limit and max_bonus + len(text_lower) < best[0]:
+                continue
+        score = _score(query_lower, char_masks[i], boundary_masks[i], len(text_lower))
+        scored.append((score, i))
+        if limit is not None:
+            if len(best) < limit:
+                heapq.heappush(best, score)
+            elif score > best[0]:
+                heapq.heapreplace(best, score)
+
+    def rank(item: Tuple[int, int]) -> Tuple[int, str]:
+        # Break ties by path so the order doesn't depend on the input order
+        return -item[0], candidates[item[1]]
+
+    if limit is None:
+        scored.sort(key=rank)
+        return candidates.subset(i for _, i in scored)
 
-    scored.sort(key=lambda t: t[0], reverse=True)
-    return [c for _, c in scored]
+    top = [i for _, i in heapq.nsmallest(limit, scored, key=rank)]
+    ranked = set(top)
+    return candidates.subset(top + [i for i in matches if i not in ranked])
@@ -19,15 +19,26 @@ Keys:
 
 from __future__ import annotations
 
+import codecs
 import logging
 import os
-import select
 import shutil
+import struct
 import sys
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional, Sequence, Tuple
+from typing import (
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 try:
+    import fcntl
     import termios
     import tty
 except ImportError:
@@ -38,19 +49,30 @@ logger = logging.getLogger(__name__)
 # ANSI helpers
 _CSI = "\033["
 _CLEAR_LINE = f"{_CSI}2K"
-_CURSOR_UP = f"{_CSI}1A"
 _HIDE_CURSOR = f"{_CSI}?25l"
 _SHOW_CURSOR = f"{_CSI}?25h"
+# Switch to the alternate screen and home the cursor / switch back
+_ENTER_ALT_SCREEN = f"{_CSI}?1049h{_CSI}H"
+_LEAVE_ALT_SCREEN = f"{_CSI}?1049l"
 _BOLD = f"{_CSI}1m"
 _CYAN = f"{_CSI}36m"
 _REVERSE = f"{_CSI}7m"
 _RESET = f"{_CSI}0m"
 
+# Prebuilt row decorations, so rendering a frame only concatenates strings
+_HEADER_PREFIX = f"{_BOLD}{_CYAN}Filter >{_RESET} "
+_CURSOR_PREFIX = f"{_REVERSE}{_BOLD}❯ "
+_MARKED_PREFIX = f"  {_CYAN}●{_RESET} "
+_UNMARKED_PREFIX = f"  {_CYAN} {_RESET} "
+
 # Maximum number of result rows to display at once
 MAX_VISIBLE_RESULTS = 15
 
+# ``slots`` needs Python 3.10; older versions keep a per-instance __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class PickerState:
     """Mutable state for the fuzzy picker."""
 
@@ -62,6 +84,10 @@ class PickerState:
     selected: Optional[List[str]] = None  # accepted results (None = cancelled)
     marked: List[str] = field(default_factory=list)  # Tab-marked items (by value)
     max_visible: int = MAX_VISIBLE_RESULTS  # result rows that fit the terminal
+    # (query, results) for the current query and each of its prefixes that
+    # was filtered on the way, shortest first
+    filter_stack: List[Tuple[str, List[str]]] = field(default_factory=list)
+    query_dirty: bool = False  # query edited but `results` not refiltered yet
 
 
 # -- Key constants -----------------------------------------------------------
@@ -76,82 +102,91 @@ KEY_SHIFT_TAB = "shift_tab"
 KEY_CHAR = "char"  # regular printable character
 
 
-@dataclass
-class KeyEvent:
+class KeyEvent(NamedTuple):
     kind: str
     char: str = ""
 
 
 _ESC_READ_RETRIES = 4  # max None returns to tolerate inside an escape sequence
+_TTY_READ_TIMEOUT = 1  # terminal read timeout (VTIME), in tenths of a second
+_TTY_READ_SIZE = 64  # bytes requested from the terminal per read
 
 
 def _read_continuation(
     read_char: Callable[[], Optional[str]],
+    retries: int = _ESC_READ_RETRIES,
 ) -> Optional[str]:
-    """Read the next real character, skipping up to *_ESC_READ_RETRIES* ``None``
+    """Read the next real character, skipping up to *retries* ``None``
     returns.
 
-    In a real terminal the default ``read_char`` uses ``select()`` on the
-    OS file descriptor, but Python's ``BufferedReader`` may have already
-    pulled the continuation bytes into its internal buffer.  ``select()``
-    then reports *no data* even though the bytes are available — so
-    ``read_char()`` returns ``None``.  Retrying a few times fixes this.
+    A reader may report *no data* between the bytes of one escape sequence,
+    e.g. when it polls with ``select()`` while Python's ``BufferedReader``
+    has already pulled the continuation bytes into its internal buffer.
+    Retrying a few times tolerates such gaps.  The terminal reader used by
+    :func:`run_picker` (:func:`make_tty_reader`) reads the fd directly and
+    only needs a single retry.
     """
-    for _ in range(_ESC_READ_RETRIES):
+    for _ in range(retries):
         ch = read_char()
         if ch is not None:
             return ch
     return None
 
 
-def _parse_arrow(direction: Optional[str]) -> Optional[KeyEvent]:
-    if direction == "A":
-        return KeyEvent(KEY_UP)
-    if direction == "B":
-        return KeyEvent(KEY_DOWN)
-    return None
-
-
-def _read_key_event(read_char: Callable[[], Optional[str]]) -> Optional[KeyEvent]:
+# Events without a character are immutable, so parsing reuses these
+_ENTER = KeyEvent(KEY_ENTER)
+_TAB = KeyEvent(KEY_TAB)
+_SHIFT_TAB = KeyEvent(KEY_SHIFT_TAB)
+_BACKSPACE = KeyEvent(KEY_BACKSPACE)
+_UP = KeyEvent(KEY_UP)
+_DOWN = KeyEvent(KEY_DOWN)
+_ESCAPE = KeyEvent(KEY_ESCAPE)
+
+# Input sequences as a trie: a node is either the event a complete sequence
+# maps to, or a dict keyed by the next character.  Escape sequences cover
+# arrow keys in normal mode (``ESC [ A/B``) and application mode
+# (``ESC O A/B``), plus Shift-Tab (``ESC [ Z``).
+_KeyNode = Union[KeyEvent, Dict[str, "_KeyNode"]]
+_KEY_TRIE: Dict[str, _KeyNode] = {
+    "\r": _ENTER,
+    "\n": _ENTER,
+    "\t": _TAB,
+    "\x7f": _BACKSPACE,  # DEL
+    "\x08": _BACKSPACE,  # Backspace
+    "\x1b": {
+        "[": {"A": _UP, "B": _DOWN, "Z": _SHIFT_TAB},
+        "O": {"A": _UP, "B": _DOWN},
+    },
+}
+
+
+def _read_key_event(
+    read_char: Callable[[], Optional[str]],
+    retries: int = _ESC_READ_RETRIES,
+) -> Optional[KeyEvent]:
     """Read one logical key event using *read_char* (a single-char reader).
 
-    Handles multi-byte escape sequences for arrow keys in both normal
-    mode (``ESC [ A/B``) and application mode (``ESC O A/B``), plus
-    Shift-Tab (``ESC [ Z``).
-    Tolerates ``None`` gaps between bytes (see :func:`_read_continuation`).
+    Walks :data:`_KEY_TRIE` one character at a time.  An escape sequence
+    that stops early (no follow-up byte: a genuine Escape press) or goes
+    off the trie (an unrecognised sequence) is treated as Escape.
+    Tolerates up to *retries* ``None`` gaps between bytes (see
+    :func:`_read_continuation`).
     """
     ch = read_char()
     if ch is None:
         return None
 
-    if ch == "\x1b":  # ESC – might be an arrow-key sequence
-        seq1 = _read_continuation(read_char)
-        if seq1 in ("[", "O"):
-            seq2 = _read_continuation(read_char)
-            arrow = _parse_arrow(seq2)
-            if arrow is not None:
-                return arrow
-            if seq1 == "[" and seq2 == "Z":  # Shift-Tab
-                return KeyEvent(KEY_SHIFT_TAB)
-        if seq1 is None:
-            # No follow-up byte at all → genuine Escape press
-            return KeyEvent(KEY_ESCAPE)
-        # Unrecognised sequence → treat as Escape
-        return KeyEvent(KEY_ESCAPE)
-
-    if ch in ("\n", "\r"):
-        return KeyEvent(KEY_ENTER)
-
-    if ch == "\t":
-        return KeyEvent(KEY_TAB)
+    node = _KEY_TRIE.get(ch)
+    if node is None:
+        # Ignore control characters that aren't bound to a key
+        return KeyEvent(KEY_CHAR, ch) if ch.isprintable() else None
 
-    if ch in ("\x7f", "\x08"):  # DEL / Backspace
-        return KeyEvent(KEY_BACKSPACE)
-
-    if ch.isprintable():
-        return KeyEvent(KEY_CHAR, ch)
-
-    return None  # ignore other control characters
+    while isinstance(node, dict):
+        ch = _read_continuation(read_char, retries)
+        if ch is None:
+            return _ESCAPE
+        node = node.get(ch, _ESCAPE)
+    return node
 
 
 # -- Rendering ---------------------------------------------------------------
@@ -164,13 +199,13 @@ def _truncate(text: str, width: int) -> str:
     return text[: max(0, width - 1)] + "…"
 
 
-def render(state: PickerState, width: int = 80) -> str:
-    """Return the full screen content for the current state.
+def render_lines(state: PickerState, width: int = 80) -> List[str]:
+    """Return the screen content for the current state, one entry per row.
 
     Every line is clipped to ``width - 1`` visible columns so it never wraps:
-    the erase loop in :func:`run_picker` counts logical lines, and a wrapped
-    line would occupy more physical rows than counted, leaving stale frames
-    on screen.
+    the redraw in :func:`run_picker` moves the cursor by logical lines, and a
+    wrapped line would occupy more physical rows than counted, leaving stale
+    frames on screen.
     """
     lines: List[str] = []
     max_cols = max(1, width - 1)
@@ -184,7 +219,7 @@ def render(state: PickerState, width: int = 80) -> str:
             query = "…" + query[len(query) - query_budget + 1 :]
         else:
             query = ""
-    lines.append(f"{_BOLD}{_CYAN}Filter >{_RESET} {query}")
+    lines.append(_HEADER_PREFIX + query)
 
     # Match count
     counts = f"  {len(state.results)}/{state.total} matches"
@@ -194,35 +229,130 @@ def render(state: PickerState, width: int = 80) -> str:
 
     # Result rows: 4-column prefix = cursor marker + mark indicator
     visible = state.results[: state.max_visible]
-    item_budget = max_cols - 4  # 4-column prefix: "❯ ● " / "  ● " / "    "
+    item_budget = _item_budget(max_cols)
     for i, item in enumerate(visible):
-        mark = "●" if item in state.marked else " "
-        item = _truncate(item, max(1, item_budget))
-        if i == state.cursor:
-            lines.append(f"{_REVERSE}{_BOLD}❯ {mark} {item}{_RESET}")
-        else:
-            lines.append(f"  {_CYAN}{mark}{_RESET} {item}")
+        lines.append(_render_item(state, i, item, item_budget))
 
     if not visible:
         lines.append(f"{_CYAN}{_truncate('  (no matches)', max_cols)}{_RESET}")
 
-    return "\r\n".join(lines)
+    return lines
+
+
+def _item_budget(max_cols: int) -> int:
+    """Columns left for a result path after the 4-column row prefix."""
+    return max(1, max_cols - 4)  # "❯ ● " / "  ● " / "    "
+
 
+def _render_item(state: PickerState, i: int, item: str, item_budget: int) -> str:
+    """Return result row *i*, showing *item*, as drawn by :func:`render_lines`."""
+    marked = item in state.marked
+    item = _truncate(item, item_budget)
+    if i == state.cursor:
+        return _CURSOR_PREFIX + ("● " if marked else "  ") + item + _RESET
+    return (_MARKED_PREFIX if marked else _UNMARKED_PREFIX) + item
 
-def _printed_line_count(text: str) -> int:
-    return len(text.splitlines())
+
+def render_cursor_move(
+    state: PickerState, prev_lines: List[str], prev_cursor: int, width: int = 80
+) -> List[str]:
+    """Return *prev_lines* with only the rows at *prev_cursor* and the cursor
+    re-rendered.
+
+    Only valid when *prev_lines* was rendered by :func:`render_lines` at the
+    same *width* and nothing but ``state.cursor`` changed since; arrow keys
+    then cost two rows instead of a full frame.
+    """
+    lines = list(prev_lines)
+    item_budget = _item_budget(max(1, width - 1))
+    visible = min(len(state.results), state.max_visible)
+    for i in {prev_cursor, state.cursor}:
+        if 0 <= i < visible:
+            lines[2 + i] = _render_item(state, i, state.results[i], item_budget)
+    return lines
+
+
+def render(state: PickerState, width: int = 80) -> str:
+    """Return the full screen content for the current state."""
+    return "\r\n".join(render_lines(state, width))
+
+
+def _redraw(prev: List[str], lines: List[str]) -> str:
+    """Return the output that turns the frame *prev* into *lines*.
+
+    Only rows that differ from *prev* are cleared and rewritten, so unchanged
+    rows cost nothing and an identical frame produces no output at all.  The
+    picker owns the alternate screen and every frame starts at its top-left
+    corner, so each row is addressed absolutely and the cursor position
+    between frames doesn't matter.
+    """
+    out: List[str] = []
+    for i, line in enumerate(lines):
+        if i >= len(prev) or line != prev[i]:
+            out.append(f"{_CSI}{i + 1};1H{_CLEAR_LINE}{line}")
+
+    # Clear rows left over from a taller previous frame
+    for i in range(len(lines), len(prev)):
+        out.append(f"{_CSI}{i + 1};1H{_CLEAR_LINE}")
+
+    return "".join(out)
 
 
 # -- Core loop ---------------------------------------------------------------
 
 
+def _refilter(
+    state: PickerState,
+    filter_fn: Callable[[str, Sequence[str]], List[str]],
+    candidates: Sequence[str],
+) -> None:
+    """Recompute ``state.results`` for ``state.query``.
+
+    Entries of ``state.filter_stack`` that are not a prefix of the query are
+    dropped.  An empty query shows every candidate without filtering.  If the
+    query itself is left on top (e.g. after backspace), its results are
+    reused without filtering.  Otherwise only the results of the longest
+    remaining prefix can still match, so they are filtered instead of the
+    full candidate list and pushed.
+    """
+    stack = state.filter_stack
+    while stack and not state.query.startswith(stack[-1][0]):
+        stack.pop()
+    if not state.query:
+        # Everything matches the empty query, in candidate order, just like
+        # the initial state; no need to run the filter over every candidate
+        state.results = list(candidates)
+    elif stack and stack[-1][0] == state.query:
+        state.results = stack[-1][1]
+    else:
+        pool = stack[-1][1] if stack else candidates
+        state.results = filter_fn(state.query, pool)
+        stack.append((state.query, state.results))
+    state.query_dirty = False
+
+
 def update_state(
     state: PickerState,
     event: KeyEvent,
     filter_fn: Callable[[str, Sequence[str]], List[str]],
     candidates: Sequence[str],
+    *,
+    defer_filter: bool = False,
 ) -> None:
-    """Apply *event* to *state*, recomputing results when the query changes."""
+    """Apply *event* to *state*, recomputing results when the query changes.
+
+    *filter_fn* must narrow monotonically: the matches for a query extended
+    by more characters are a subset of the matches for the shorter query.
+    That lets typing filter only the previous results instead of every
+    candidate.
+
+    With *defer_filter*, a query edit only sets ``state.query_dirty``; the
+    results are recomputed by the next event that needs them, or by the
+    caller through :func:`_refilter`.
+    """
+    if state.query_dirty and event.kind not in (KEY_CHAR, KEY_BACKSPACE):
+        _refilter(state, filter_fn, candidates)
+
     if event.kind == KEY_ESCAPE:
         state.done = True
         state.selected = None
@@ -258,8 +388,11 @@ def update_state(
     if event.kind == KEY_BACKSPACE:
         if state.query:
             state.query = state.query[:-1]
-            state.results = filter_fn(state.query, candidates)
             state.cursor = 0
+            if defer_filter:
+                state.query_dirty = True
+            else:
+                _refilter(state, filter_fn, candidates)
         return
 
     if event.kind == KEY_UP:
@@ -273,29 +406,82 @@ def update_state(
 
     if event.kind == KEY_CHAR:
         state.query += event.char
-        state.results = filter_fn(state.query, candidates)
         state.cursor = 0
+        if defer_filter:
+            state.query_dirty = True
+        else:
+            _refilter(state, filter_fn, candidates)
         return
 
 
-def make_raw_reader(fd: int) -> Callable[[], Optional[str]]:
-    """Create a single-byte reader that operates directly on a file descriptor.
+def make_pending_check(fd: int) -> Callable[[], bool]:
+    """Create a check for input that has arrived on *fd* but not been read.
 
-    Unlike ``sys.stdin.read(1)``, this uses ``os.read(fd, 1)`` so that
-    ``select()`` and reads share the same OS-level buffer.  This prevents
-    Python's ``BufferedReader`` from eagerly consuming bytes and hiding
-    them from ``select()``, which caused arrow-key escape sequences to be
-    misinterpreted as bare Escape.
+    Asks the terminal driver for its queued byte count (``FIONREAD``), which
+    doesn't block or consume anything.
     """
 
-    def read_char() -> Optional[str]:
-        if select.select([fd], [], [], 0.05)[0]:
-            data = os.read(fd, 1)
-            if data:
-                return data.decode("utf-8", errors="replace")
-        return None
+    def input_pending() -> bool:
+        queued = fcntl.ioctl(fd, termios.FIONREAD, b"\0\0\0\0")
+        return struct.unpack("i", queued)[0] > 0
+
+    return input_pending
+
 
-    return read_char
+class _TtyReader:
+    """Single-character reader for a terminal configured by
+    :func:`_set_read_timeout`.
+
+    Bytes are read from the fd in bursts of up to :data:`_TTY_READ_SIZE`
+    and handed out one character at a time, so an escape sequence or a
+    pasted string costs one ``os.read`` instead of one per byte.  Reading the
+    fd directly (not through ``sys.stdin``) keeps Python's ``BufferedReader``
+    from holding back bytes, and there is no ``select()`` call per read: the
+    terminal driver enforces the timeout.  Multi-byte UTF-8 characters are
+    decoded incrementally, so one split across two reads still arrives
+    whole.
+    """
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self._driver_pending = make_pending_check(fd)
+
+    def __call__(self) -> Optional[str]:
+        """Return the next character, or ``None`` once the timeout passes
+        without input."""
+        if not self._buffer:
+            data = os.read(self._fd, _TTY_READ_SIZE)
+            if not data:
+                return None
+            self._buffer = self._decoder.decode(data)
+            if not self._buffer:
+                return None  # incomplete UTF-8 character, the rest follows
+        ch = self._buffer[0]
+        self._buffer = self._buffer[1:]
+        return ch
+
+    def input_pending(self) -> bool:
+        """Whether more input is buffered here or queued in the terminal."""
+        return bool(self._buffer) or self._driver_pending()
+
+
+def make_tty_reader(fd: int) -> _TtyReader:
+    """Create a reader for the terminal *fd*; see :class:`_TtyReader`."""
+    return _TtyReader(fd)
+
+
+def _set_read_timeout(fd: int) -> None:
+    """Make reads on the terminal *fd* wait at most :data:`_TTY_READ_TIMEOUT`.
+
+    With ``VMIN=0`` a read returns as soon as one byte is available, and
+    ``VTIME`` bounds how long it waits when there is none.
+    """
+    attrs = termios.tcgetattr(fd)
+    attrs[6][termios.VMIN] = 0
+    attrs[6][termios.VTIME] = _TTY_READ_TIMEOUT
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
 
 
 def _terminal_size() -> Tuple[int, int]:
@@ -311,15 +497,21 @@ def run_picker(
     _read_char: Optional[Callable[[], Optional[str]]] = None,
     _write: Optional[Callable[[str], None]] = None,
     _get_size: Optional[Callable[[], Tuple[int, int]]] = None,
+    _input_pending: Optional[Callable[[], bool]] = None,
 ) -> Optional[List[str]]:
     """Run the interactive picker and return the selected paths, or ``None``.
 
     Tab / Shift-Tab mark multiple items; Enter returns the marked items, or
     the item under the cursor when nothing is marked.  Escape returns ``None``.
 
-    *_read_char*, *_write* and *_get_size* are injectable for testing; when
-    ``None`` they default to reading from ``sys.stdin`` (in cbreak mode),
-    writing to ``sys.stdout`` and querying the real terminal size.
+    While more typed input is already queued, query edits are applied
+    without refiltering or redrawing, so a burst of keystrokes (or a paste)
+    costs one filter pass instead of one per character.
+
+    *_read_char*, *_write*, *_get_size* and *_input_pending* are injectable
+    for testing; when ``None`` they default to reading from ``sys.stdin``
+    (in raw mode), writing to ``sys.stdout``, querying the real terminal
+    size and checking stdin for queued input.
     """
     if _get_size is None:
         _get_size = _terminal_size
@@ -330,57 +522,91 @@ def run_picker(
             sys.stdout.write(s)
             sys.stdout.flush()
 
-    manage_terminal = _read_char is None
-
-    if _read_char is None:
-        _read_char = make_raw_reader(sys.stdin.fileno())
-
     state = PickerState(
         results=list(candidates),
         total=len(candidates),
     )
 
-    # Switch to raw mode to suppress character echo during interactive input.
-    # cbreak mode (used by the watcher) leaves echo enabled, which causes
-    # typed characters to appear at the cursor position before the picker
-    # redraws the frame — leading to duplicated first letters on screen.
     old_attrs = None
-    if manage_terminal:
+    esc_retries = _ESC_READ_RETRIES
+    if _read_char is None:
         fd = sys.stdin.fileno()
         old_attrs = termios.tcgetattr(fd)
-        tty.setraw(fd)
+        reader = make_tty_reader(fd)
+        _read_char = reader
+        if _input_pending is None:
+            _input_pending = reader.input_pending
+        # The bytes of an escape sequence arrive together from a terminal,
+        # so a single timed-out read after ESC means a bare Escape press
+        esc_retries = 1
+
+    if _input_pending is None:
+
+        def _input_pending() -> bool:
+            return False
 
-    _write(_HIDE_CURSOR)
-    prev_lines = 0
+    prev_lines: List[str] = []
+    prev_size: Tuple[int, int] = (0, 0)
+    prev_cursor = 0
+    # True when only the cursor may have moved since prev_lines was rendered
+    cursor_only = False
 
     try:
+        if old_attrs is not None:
+            # Switch to raw mode to suppress character echo during
+            # interactive input.  cbreak mode (used by the watcher) leaves
+            # echo enabled, which causes typed characters to appear at the
+            # cursor position before the picker redraws the frame — leading
+            # to duplicated first letters on screen.
+            tty.setraw(fd)
+            # Let the terminal driver time out idle reads instead of
+            # polling with select()
+            _set_read_timeout(fd)
+
         while not state.done:
-            # Erase previous frame
-            if prev_lines:
-                _write(_CURSOR_UP * (prev_lines - 1))
-                _write("\r")
-                for _ in range(prev_lines):
-                    _write(f"{_CLEAR_LINE}\r\n")
-                _write(_CURSOR_UP * prev_lines)
-                _write("\r")
+            if state.query_dirty:
+                if _input_pending():
+                    # More keys are queued: skip the frame, keep reading
+                    event = _read_key_event(_read_char, esc_retries)
+                    if event is not None:
+                        update_state(
+                            state, event, filter_fn, candidates, defer_filter=True
+                        )
+                    continue
+                _refilter(state, filter_fn, candidates)
 
             cols, rows = _get_size()
             # 2 header lines + 1 spare row so a full frame never scrolls
             state.max_visible = max(1, min(MAX_VISIBLE_RESULTS, rows - 3))
             state.cursor = min(state.cursor, state.max_visible - 1)
 
-            frame = render(state, width=cols)
-            _write(frame)
-            prev_lines = _printed_line_count(frame)
-
-            event = _read_key_event(_read_char)
+            # Rewrite only the rows that changed since the previous frame,
+            # in a single write
+            if cursor_only and (cols, state.max_visible) == prev_size:
+                lines = render_cursor_move(state, prev_lines, prev_cursor, width=cols)
+            else:
+                lines = render_lines(state, width=cols)
+            frame = _redraw(prev_lines, lines)
+            if not prev_lines:
+                frame = _ENTER_ALT_SCREEN + _HIDE_CURSOR + frame
+            # Idle timeouts and no-op keys leave the screen as it is
+            if frame:
+                _write(frame)
+            prev_lines = lines
+            prev_size = (cols, state.max_visible)
+            prev_cursor = state.cursor
+
+            event = _read_key_event(_read_char, esc_retries)
+            # A timed-out read changes nothing; arrow keys only move the cursor
+            cursor_only = event is None or event.kind in (KEY_UP, KEY_DOWN)
             if event is None:
                 continue
-            update_state(state, event, filter_fn, candidates)
+            update_state(
+                state, event, filter_fn, candidates, defer_filter=_input_pending()
+            )
     finally:
-        _write(_SHOW_CURSOR)
-        # Move below the rendered frame so the next output starts clean
-        _write("\r\n")
+        # Back to the main screen, with its content and cursor as they were
+        _write(_SHOW_CURSOR + _LEAVE_ALT_SCREEN)
         # Restore the previous terminal mode
         if old_attrs is not None:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
@@ -156,6 +156,15 @@ def test_find_config(
     assert got == pyproject_toml_path, "Config file not found"
 
 
+def test_find_config_searches_parent_directories(
+    tmp_path: Path, pyproject_toml_path: Path
+):
+    work_dir = tmp_path.joinpath("test/nested/dir")
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    assert find_config(work_dir) == pyproject_toml_path
+
+
 def test_parse_config_no_section(pyproject_toml_path: Path):
     pyproject_toml_path.write_text("[tool.another_section]\ndelay = 2\nrunner = 'tox'\n")
 
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from pytest_watcher.fuzzy import find_test_files, fuzzy_filter, fuzzy_match
+import pytest
+
+from pytest_watcher.fuzzy import (
+    Candidates,
+    find_test_files,
+    fuzzy_filter,
+    fuzzy_match,
+)
 
 # ---------------------------------------------------------------------------
 # fuzzy_match
@@ -11,40 +18,74 @@ from pytest_watcher.fuzzy import find_test_files, fuzzy_filter, fuzzy_match
 
 class TestFuzzyMatch:
     def test_exact_substring(self):
-        matched, score = fuzzy_match("foo", "foobar")
-        assert matched is True
-        assert score > 0
+        assert fuzzy_match("foo", "foobar") > 0
 
     def test_case_insensitive(self):
-        matched, _ = fuzzy_match("FOO", "foobar")
-        assert matched is True
+        assert fuzzy_match("FOO", "foobar") >= 0
 
     def test_characters_in_order(self):
-        matched, _ = fuzzy_match("tmd", "test_my_decorator.py")
-        assert matched is True
+        assert fuzzy_match("tmd", "test_my_decorator.py") >= 0
 
     def test_no_match(self):
-        matched, score = fuzzy_match("xyz", "foobar")
-        assert matched is False
+        assert fuzzy_match("xyz", "foobar") < 0
 
     def test_empty_query_always_matches(self):
-        matched, _ = fuzzy_match("", "anything")
-        assert matched is True
+        assert fuzzy_match("", "anything") >= 0
 
     def test_query_longer_than_text(self):
-        matched, _ = fuzzy_match("abcdef", "abc")
-        assert matched is False
+        assert fuzzy_match("abcdef", "abc") < 0
 
     def test_consecutive_bonus(self):
-        _, score_consecutive = fuzzy_match("ab", "ab_cd")
-        _, score_spread = fuzzy_match("ab", "a___b")
-        assert score_consecutive > score_spread
+        assert fuzzy_match("ab", "ab_cd") > fuzzy_match("ab", "a___b")
 
     def test_boundary_bonus(self):
         # 'c' at word boundary after '_' should score higher
-        _, score_boundary = fuzzy_match("tc", "test_cache.py")
-        _, score_mid = fuzzy_match("tc", "test_factory.py")
-        assert score_boundary >= score_mid
+        assert fuzzy_match("tc", "test_cache.py") >= fuzzy_match("tc", "test_factory.py")
+
+
+# ---------------------------------------------------------------------------
+# Candidates
+# ---------------------------------------------------------------------------
+
+
+class TestCandidates:
+    def test_behaves_as_list(self):
+        candidates = Candidates(["b.py", "a.py"])
+        assert candidates == ["b.py", "a.py"]
+        assert "a.py" in candidates
+
+    def test_precomputes_lowercase(self):
+        candidates = Candidates(["Tests/Test_Auth.py"])
+        assert candidates.lowers == ["tests/test_auth.py"]
+
+    def test_boundary_mask_marks_word_starts(self):
+        candidates = Candidates(["ab/cd_e"])
+        # word starts: 'a' (0), 'c' (3), 'e' (6)
+        assert candidates.boundary_masks == [0b1001001]
+
+    def test_char_masks_record_positions(self):
+        candidates = Candidates(["abca"])
+        assert candidates.char_masks == [{"a": 0b1001, "b": 0b10, "c": 0b100}]
+
+    def test_reuse_copies_known_paths(self):
+        previous = Candidates(["A.py", "B.py"])
+        candidates = Candidates(["B.py", "C.py"], reuse=previous)
+        assert candidates.char_masks[0] is previous.char_masks[1]
+        fresh = Candidates(["B.py", "C.py"])
+        assert candidates.lowers == fresh.lowers
+        assert candidates.boundary_masks == fresh.boundary_masks
+        assert candidates.char_masks == fresh.char_masks
+
+    def test_subset_keeps_precomputed_data(self):
+        candidates = Candidates(["A.py", "B.py", "C.py"])
+        sub = candidates.subset([2, 0])
+        assert sub == ["C.py", "A.py"]
+        assert sub.lowers == ["c.py", "a.py"]
+        assert sub.boundary_masks == [
+            candidates.boundary_masks[2],
+            candidates.boundary_masks[0],
+        ]
+        assert sub.char_masks == [candidates.char_masks[2], candidates.char_masks[0]]
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +123,36 @@ class TestFuzzyFilter:
         result = fuzzy_filter("zzzzz", self.CANDIDATES)
         assert result == []
 
+    def test_ties_ordered_by_path(self):
+        result = fuzzy_filter("x", ["b_x.py", "a_x.py"])
+        assert result == ["a_x.py", "b_x.py"]
+
+    def test_limit_ranks_best_matches_first(self):
+        result = fuzzy_filter("t", self.CANDIDATES, limit=2)
+        assert result[:2] == fuzzy_filter("t", self.CANDIDATES)[:2]
+
+    def test_limit_keeps_all_matches(self):
+        result = fuzzy_filter("t", self.CANDIDATES, limit=2)
+        assert sorted(result) == sorted(self.CANDIDATES)
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_non_positive_limit_rejected(self, limit: int):
+        with pytest.raises(ValueError, match="limit must be positive"):
+            fuzzy_filter("a", ["a.py"], limit=limit)
+
+    def test_accepts_precomputed_candidates(self):
+        candidates = Candidates(self.CANDIDATES)
+        result = fuzzy_filter("model", candidates)
+        assert result == fuzzy_filter("model", self.CANDIDATES)
+        assert isinstance(result, Candidates)
+
+    def test_empty_query_keeps_precomputed_candidates(self):
+        candidates = Candidates(self.CANDIDATES)
+        result = fuzzy_filter("", candidates)
+        assert result == self.CANDIDATES
+        assert isinstance(result, Candidates)
+        assert result is not candidates
+
 
 # ---------------------------------------------------------------------------
 # find_test_files
@@ -105,6 +176,38 @@ class TestFindTestFiles:
         assert str(Path("sub/test_gamma.py")) in files
         assert "helper_utils.py" not in files
 
+    def test_skips_vendor_directories(self, tmp_path_factory: pytest.TempPathFactory):
+        # A real temporary directory: the repo-local tmp_path is not a place
+        # to create .git or .venv directories
+        root = tmp_path_factory.mktemp("vendored")
+        for name in (".git", ".venv", "venv", "node_modules", "__pycache__", ".tox"):
+            (root / name).mkdir()
+            (root / name / "test_vendor.py").write_text("")
+        (root / "test_own.py").write_text("")
+
+        assert find_test_files(root) == ["test_own.py"]
+
+    def test_skips_ignore_patterns(self, tmp_path_factory: pytest.TempPathFactory):
+        root = tmp_path_factory.mktemp("ignored")
+        (root / "generated").mkdir()
+        (root / "generated" / "test_gen.py").write_text("")
+        (root / "test_slow.py").write_text("")
+        (root / "test_own.py").write_text("")
+
+        files = find_test_files(root, ignore_patterns=["*/generated", "test_slow.py"])
+
+        assert files == ["test_own.py"]
+
+    def test_any_pattern_matches(self, tmp_path_factory: pytest.TempPathFactory):
+        root = tmp_path_factory.mktemp("patterns")
+        for name in ("test_a.py", "b_test.py", "check_c.py", "d.py"):
+            (root / name).write_text("")
+
+        files = find_test_files(root, patterns=["test_*.py", "check_*.py"])
+
+        assert files == ["check_c.py", "test_a.py"]
+        assert find_test_files(root, patterns=[]) == []
+
     def test_empty_directory(self, tmp_path: Path):
         empty = tmp_path / "empty"
         empty.mkdir(exist_ok=True)
@@ -7,6 +7,7 @@ import pytest
 
 from pytest_watcher.commands import FuzzyFilterCommand
 from pytest_watcher.config import Config
+from pytest_watcher.fuzzy import find_test_files
 from pytest_watcher.terminal import Terminal
 from pytest_watcher.trigger import Trigger
 
@@ -102,6 +103,26 @@ class TestFuzzyFilterCommand:
         assert config.runner_args == ["-v", "--tb=short", "test_bar.py", "test_foo.py"]
         assert trigger.is_active()
 
+    def test_reuses_previous_scan(
+        self, command, trigger, mock_terminal, tmp_path_factory: pytest.TempPathFactory
+    ):
+        # A real temporary directory: the repo-local tmp_path is shared and
+        # lives inside the checkout
+        root = tmp_path_factory.mktemp("reuse")
+        (root / "test_foo.py").write_text("")
+        config = Config(path=root)
+
+        with patch("pytest_watcher.picker.run_picker", return_value=None):
+            command.run(trigger, mock_terminal, config)
+            first = command._test_files
+            with patch(
+                "pytest_watcher.fuzzy.find_test_files", wraps=find_test_files
+            ) as find:
+                command.run(trigger, mock_terminal, config)
+
+        assert find.call_args.kwargs["reuse"] is first
+        assert command._test_files is not first
+
     def test_command_metadata(self):
         assert FuzzyFilterCommand.character == "t"
         assert FuzzyFilterCommand.show_in_menu is True
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import os
 import re
-from typing import List, Optional, Sequence
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import pytest
 
 from pytest_watcher.picker import (
     KEY_BACKSPACE,
@@ -17,8 +20,13 @@ from pytest_watcher.picker import (
     KeyEvent,
     PickerState,
     _read_key_event,
-    make_raw_reader,
+    _redraw,
+    _set_read_timeout,
+    make_pending_check,
+    make_tty_reader,
     render,
+    render_cursor_move,
+    render_lines,
     run_picker,
     update_state,
 )
@@ -44,6 +52,31 @@ def _visible(text: str) -> str:
     return _ANSI_RE.sub("", text)
 
 
+class _Screen:
+    """Minimal terminal model for the escapes :func:`_redraw` emits.
+
+    Any other escape sequence (colours, cursor visibility) is ignored.
+    """
+
+    _TOKEN_RE = re.compile(r"\x1b\[(\d*);1H|\x1b\[2K|\x1b\[[0-9;?]*[A-Za-z]|[^\x1b]+")
+
+    def __init__(self) -> None:
+        self.rows: List[str] = []
+        self.row = 0
+
+    def feed(self, data: str) -> None:
+        for m in self._TOKEN_RE.finditer(data):
+            token = m.group(0)
+            if m.group(1) is not None:
+                self.row = int(m.group(1) or 1) - 1
+                while len(self.rows) <= self.row:
+                    self.rows.append("")
+            elif token == "\x1b[2K":
+                self.rows[self.row] = ""
+            elif not token.startswith("\x1b"):
+                self.rows[self.row] += token
+
+
 def _identity_filter(query: str, candidates: Sequence[str]) -> List[str]:
     """Trivial filter that returns all candidates (for state-only tests)."""
     if not query:
@@ -51,6 +84,17 @@ def _identity_filter(query: str, candidates: Sequence[str]) -> List[str]:
     return [c for c in candidates if query.lower() in c.lower()]
 
 
+def _recording_filter(log: List[Tuple[str, List[str]]]):
+    """Return an :func:`_identity_filter` that appends ``(query, pool)`` to
+    *log* for every call."""
+
+    def filter_fn(query: str, candidates: Sequence[str]) -> List[str]:
+        log.append((query, list(candidates)))
+        return _identity_filter(query, candidates)
+
+    return filter_fn
+
+
 def _make_char_reader(chars: str):
     """Return a callable that yields one char at a time from *chars*."""
     it = iter(chars)
@@ -97,6 +141,10 @@ class TestReadKeyEvent:
         ev = _read_key_event(_make_char_reader("\n"))
         assert ev == KeyEvent(KEY_ENTER)
 
+    def test_events_without_char_are_reused(self):
+        reader = _make_char_reader("\r\r")
+        assert _read_key_event(reader) is _read_key_event(reader)
+
     def test_backspace_del(self):
         ev = _read_key_event(_make_char_reader("\x7f"))
         assert ev == KeyEvent(KEY_BACKSPACE)
@@ -195,6 +243,13 @@ class TestUpdateState:
             total=len(CANDIDATES),
         )
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs dataclass slots")
+    def test_state_uses_slots(self):
+        state = self._new_state()
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.qurey = "typo"  # type: ignore[attr-defined]
+
     def test_char_appends_to_query(self):
         state = self._new_state()
         update_state(state, KeyEvent(KEY_CHAR, "a"), _identity_filter, CANDIDATES)
@@ -210,6 +265,68 @@ class TestUpdateState:
         assert state.query == "auth"
         assert state.results == ["tests/test_auth.py"]
 
+    def test_typing_filters_previous_results(self):
+        log: list[tuple[str, list[str]]] = []
+        recording_filter = _recording_filter(log)
+
+        state = self._new_state()
+        update_state(state, KeyEvent(KEY_CHAR, "c"), recording_filter, CANDIDATES)
+        update_state(state, KeyEvent(KEY_CHAR, "a"), recording_filter, CANDIDATES)
+        assert log == [
+            ("c", CANDIDATES),
+            ("ca", ["tests/test_cache.py", "tests/test_commands.py"]),
+        ]
+        assert state.results == ["tests/test_cache.py"]
+
+    def test_deferred_typing_filters_on_next_event(self):
+        log: list[tuple[str, list[str]]] = []
+        recording_filter = _recording_filter(log)
+
+        state = self._new_state()
+        for ch in "auth":
+            update_state(
+                state,
+                KeyEvent(KEY_CHAR, ch),
+                recording_filter,
+                CANDIDATES,
+                defer_filter=True,
+            )
+        assert state.query == "auth"
+        assert state.query_dirty
+        assert log == []
+
+        update_state(state, KeyEvent(KEY_ENTER), recording_filter, CANDIDATES)
+        assert log == [("auth", CANDIDATES)]
+        assert state.selected == ["tests/test_auth.py"]
+
+    def test_backspace_reuses_earlier_results(self):
+        log: list[tuple[str, list[str]]] = []
+        recording_filter = _recording_filter(log)
+
+        state = self._new_state()
+        for ch in "cx":
+            update_state(state, KeyEvent(KEY_CHAR, ch), recording_filter, CANDIDATES)
+        update_state(state, KeyEvent(KEY_BACKSPACE), recording_filter, CANDIDATES)
+        assert state.query == "c"
+        assert state.results == ["tests/test_cache.py", "tests/test_commands.py"]
+        # Only "c" and "cx" were filtered; backspace reused the results for "c"
+        assert [query for query, _ in log] == ["c", "cx"]
+
+        update_state(state, KeyEvent(KEY_CHAR, "o"), recording_filter, CANDIDATES)
+        assert log[-1] == ("co", ["tests/test_cache.py", "tests/test_commands.py"])
+        assert state.results == ["tests/test_commands.py"]
+
+    def test_backspace_to_empty_query_skips_filter(self):
+        log: list[tuple[str, list[str]]] = []
+        recording_filter = _recording_filter(log)
+
+        state = self._new_state()
+        update_state(state, KeyEvent(KEY_CHAR, "c"), recording_filter, CANDIDATES)
+        update_state(state, KeyEvent(KEY_BACKSPACE), recording_filter, CANDIDATES)
+        assert state.query == ""
+        assert state.results == CANDIDATES
+        assert log == [("c", CANDIDATES)]
+
     def test_backspace_removes_last_char(self):
         state = self._new_state()
         state.query = "ab"
@@ -477,6 +594,82 @@ class TestRender:
         assert len(_visible(cursor_lines[0])) <= 29
 
 
+class TestRenderLines:
+    def test_matches_render(self):
+        state = PickerState(query="a", results=["a.py", "b.py"], total=2)
+        assert "\r\n".join(render_lines(state)) == render(state)
+
+
+class TestRenderCursorMove:
+    @pytest.mark.parametrize(
+        ("start", "key"), [(0, KEY_DOWN), (2, KEY_UP), (4, KEY_DOWN)]
+    )
+    def test_matches_full_render(self, start: int, key: str):
+        state = PickerState(results=list(CANDIDATES), total=5, cursor=start)
+        state.marked.append(CANDIDATES[1])
+        prev_lines = render_lines(state, width=40)
+
+        update_state(state, KeyEvent(key), _identity_filter, CANDIDATES)
+
+        assert render_cursor_move(state, prev_lines, start, width=40) == render_lines(
+            state, width=40
+        )
+
+    def test_no_results(self):
+        state = PickerState(results=[], total=5, cursor=0)
+        prev_lines = render_lines(state)
+        update_state(state, KeyEvent(KEY_DOWN), _identity_filter, CANDIDATES)
+        assert render_cursor_move(state, prev_lines, 0) == render_lines(state)
+
+
+# ---------------------------------------------------------------------------
+# _redraw
+# ---------------------------------------------------------------------------
+
+
+class TestRedraw:
+    def test_first_frame_writes_every_row(self):
+        output = _redraw([], ["one", "two"])
+        assert "one" in output
+        assert "two" in output
+
+    def test_unchanged_rows_are_not_rewritten(self):
+        output = _redraw(["one", "two", "three"], ["one", "TWO", "three"])
+        assert "TWO" in output
+        assert "one" not in output
+        assert "three" not in output
+
+    def test_identical_frame_writes_no_content(self):
+        output = _redraw(["one", "two"], ["one", "two"])
+        assert _visible(output).strip() == ""
+
+    def test_shorter_frame_clears_leftover_rows(self):
+        output = _redraw(["one", "two", "three"], ["one"])
+        assert output == "\x1b[2;1H\x1b[2K\x1b[3;1H\x1b[2K"
+
+    def test_jumps_to_changed_rows(self):
+        prev = [f"row {i}" for i in range(10)]
+        lines = prev[:3] + ["ROW 3"] + prev[4:]
+        assert _redraw(prev, lines) == "\x1b[4;1H\x1b[2KROW 3"
+
+    @pytest.mark.parametrize(
+        ("prev", "lines"),
+        [
+            ([], ["a", "b", "c"]),
+            (["a", "b"], ["a", "B", "c", "d"]),
+            (["a", "b", "c", "d"], ["A", "b"]),
+            (["a", "b", "c"], ["a", "b", "c"]),
+            (["a", "b", "c"], ["x", "b", "y"]),
+        ],
+    )
+    def test_screen_matches_new_frame(self, prev: List[str], lines: List[str]):
+        screen = _Screen()
+        screen.feed(_redraw([], prev))
+        screen.feed(_redraw(prev, lines))
+        assert screen.rows[: len(lines)] == lines
+        assert all(not r for r in screen.rows[len(lines) :])
+
+
 # ---------------------------------------------------------------------------
 # run_picker  (end-to-end with injected I/O)
 # ---------------------------------------------------------------------------
@@ -581,6 +774,63 @@ class TestRunPicker:
         _, output = self._simulate("\t\r")
         assert "(1 selected)" in output
 
+    def test_uses_alt_screen(self):
+        _, output = self._simulate("\r")
+        # Enters the alternate screen before drawing, leaves it on exit
+        assert output.startswith("\x1b[?1049h")
+        assert output.endswith("\x1b[?1049l")
+
+    def test_one_write_per_frame(self):
+        writes: list[str] = []
+        run_picker(
+            CANDIDATES,
+            _identity_filter,
+            _read_char=_make_char_reader("a\x1b[B\r"),
+            _write=writes.append,
+        )
+        # Initial frame, one frame per key except the final Enter, then the
+        # closing write that restores the cursor
+        assert len(writes) == 4
+        assert writes[-1] == "\x1b[?25h\x1b[?1049l"
+
+    def test_unchanged_frames_are_not_written(self):
+        writes: list[str] = []
+        run_picker(
+            CANDIDATES,
+            _identity_filter,
+            # Idle timeouts, then Up on the first row: nothing to redraw
+            _read_char=_make_gapped_reader([None, None, "\x1b", "[", "A", "\r"]),
+            _write=writes.append,
+        )
+        # Initial frame and the closing write only
+        assert len(writes) == 2
+
+    def test_queued_keys_are_filtered_once(self):
+        keys = list("auth\r")
+        log: list[tuple[str, list[str]]] = []
+
+        writes: list[str] = []
+        selected = run_picker(
+            CANDIDATES,
+            _recording_filter(log),
+            _read_char=lambda: keys.pop(0) if keys else None,
+            _write=writes.append,
+            # Pretend the whole string was pasted: input stays queued until
+            # the final Enter
+            _input_pending=lambda: len(keys) > 1,
+        )
+        assert selected == ["tests/test_auth.py"]
+        assert log == [("auth", CANDIDATES)]
+        # Initial frame, one frame for the whole burst, then the closing write
+        assert len(writes) == 3
+
+    def test_cursor_move_rewrites_only_changed_rows(self):
+        _, output = self._simulate("\x1b[B\r")
+        # Moving the cursor re-renders rows 0 and 1; the rest are left alone
+        assert output.count(CANDIDATES[0]) == 2
+        assert output.count(CANDIDATES[1]) == 2
+        assert output.count(CANDIDATES[4]) == 1
+
 
 # ---------------------------------------------------------------------------
 # run_picker — small terminal
@@ -612,15 +862,19 @@ class TestRunPickerSmallTerminal:
 
     def test_no_line_exceeds_terminal_width(self):
         _, output = self._simulate("\r", size=(40, 8))
-        for line in _visible(output).splitlines():
+        screen = _Screen()
+        screen.feed(output)
+        for line in screen.rows:
             assert len(line) <= 39
 
     def test_rows_clamped_to_terminal_height(self):
         _, output = self._simulate("\r", size=(40, 8))
+        screen = _Screen()
+        screen.feed(output)
         # 8 rows - 2 headers - 1 spare = 5 result rows max
         result_rows = [
             line
-            for line in _visible(output).splitlines()
+            for line in screen.rows
             if "centrosmo" in line or "…" in line and "Filter" not in line
         ]
         # A single frame is drawn before Enter
@@ -736,89 +990,105 @@ class TestRunPickerGappedReads:
 
 
 # ---------------------------------------------------------------------------
-# make_raw_reader — verifying the unbuffered fd reader
+# make_tty_reader — reads timed out by the terminal driver
 # ---------------------------------------------------------------------------
 
 
-class TestMakeRawReader:
-    """Verify that ``make_raw_reader`` uses ``os.read`` on the raw fd
-    so that ``select()`` and reads operate on the same OS-level buffer.
-    """
-
-    def test_reads_single_byte_via_os_read(self):
-        r_fd, w_fd = os.pipe()
-        try:
-            os.write(w_fd, b"x")
-            reader = make_raw_reader(r_fd)
-            assert reader() == "x"
-        finally:
-            os.close(r_fd)
-            os.close(w_fd)
-
-    def test_returns_none_when_no_data(self):
-        r_fd, w_fd = os.pipe()
-        try:
-            reader = make_raw_reader(r_fd)
-            assert reader() is None
-        finally:
-            os.close(r_fd)
-            os.close(w_fd)
-
-    def test_reads_escape_sequence_byte_by_byte(self):
+class TestMakeTtyReader:
+    @pytest.fixture
+    def pty_fds(self):
+        pty = pytest.importorskip("pty")
+        tty = pytest.importorskip("tty")
+        master_fd, slave_fd = pty.openpty()
+        tty.setraw(slave_fd)
+        _set_read_timeout(slave_fd)
+        yield master_fd, slave_fd
+        os.close(master_fd)
+        os.close(slave_fd)
+
+    def test_reads_single_byte(self, pty_fds):
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, b"x")
+        reader = make_tty_reader(slave_fd)
+        assert reader() == "x"
+
+    def test_returns_none_after_timeout(self, pty_fds):
+        _, slave_fd = pty_fds
+        reader = make_tty_reader(slave_fd)
+        assert reader() is None
+
+    def test_pending_check(self, pty_fds):
+        master_fd, slave_fd = pty_fds
+        input_pending = make_pending_check(slave_fd)
+        assert not input_pending()
+        os.write(master_fd, b"ab")
+        assert input_pending()
+        reader = make_tty_reader(slave_fd)
+        reader()
+        reader()
+        assert not input_pending()
+
+    def test_burst_is_buffered(self, pty_fds):
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, b"abc")
+        reader = make_tty_reader(slave_fd)
+        assert reader() == "a"
+        # "bc" came in with the same read and now waits in the reader
+        assert not make_pending_check(slave_fd)()
+        assert reader.input_pending()
+        assert reader() == "b"
+        assert reader() == "c"
+        assert not reader.input_pending()
+
+    def test_decodes_multibyte_characters(self, pty_fds):
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, "é€".encode())
+        reader = make_tty_reader(slave_fd)
+        assert reader() == "é"
+        assert reader() == "€"
+
+    def test_character_split_across_reads(self, pty_fds):
+        master_fd, slave_fd = pty_fds
+        data = "é".encode()
+        reader = make_tty_reader(slave_fd)
+        os.write(master_fd, data[:1])
+        assert reader() is None
+        os.write(master_fd, data[1:])
+        assert reader() == "é"
+
+    def test_arrow_key_parsed_correctly(self, pty_fds):
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, b"\x1b[A")
+        reader = make_tty_reader(slave_fd)
+        assert _read_key_event(reader, retries=1) == KeyEvent(KEY_UP)
+
+    def test_reads_escape_sequence_byte_by_byte(self, pty_fds):
         """All 3 bytes of an arrow sequence must be individually readable."""
-        r_fd, w_fd = os.pipe()
-        try:
-            os.write(w_fd, b"\x1b[B")
-            reader = make_raw_reader(r_fd)
-            assert reader() == "\x1b"
-            assert reader() == "["
-            assert reader() == "B"
-            assert reader() is None
-        finally:
-            os.close(r_fd)
-            os.close(w_fd)
-
-    def test_arrow_key_parsed_correctly_via_raw_reader(self):
-        """End-to-end: raw reader → _read_key_event → correct arrow event."""
-        r_fd, w_fd = os.pipe()
-        try:
-            os.write(w_fd, b"\x1b[A")
-            reader = make_raw_reader(r_fd)
-            ev = _read_key_event(reader)
-            assert ev == KeyEvent(KEY_UP)
-        finally:
-            os.close(r_fd)
-            os.close(w_fd)
-
-    def test_multiple_arrow_keys_via_raw_reader(self):
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, b"\x1b[B")
+        reader = make_tty_reader(slave_fd)
+        assert reader() == "\x1b"
+        assert reader() == "["
+        assert reader() == "B"
+        assert reader() is None
+
+    def test_multiple_arrow_keys(self, pty_fds):
         """Two arrow sequences written at once are parsed individually."""
-        r_fd, w_fd = os.pipe()
-        try:
-            os.write(w_fd, b"\x1b[B\x1b[A")  # ↓ then ↑
-            reader = make_raw_reader(r_fd)
-            ev1 = _read_key_event(reader)
-            ev2 = _read_key_event(reader)
-            assert ev1 == KeyEvent(KEY_DOWN)
-            assert ev2 == KeyEvent(KEY_UP)
-        finally:
-            os.close(r_fd)
-            os.close(w_fd)
-
-    def test_run_picker_with_raw_reader_on_pipe(self):
-        """Full picker run using a raw reader on a real fd (pipe)."""
-        r_fd, w_fd = os.pipe()
-        try:
-            # Write: ↓ ↓ Enter
-            os.write(w_fd, b"\x1b[B\x1b[B\r")
-            output_buf: list[str] = []
-            reader = make_raw_reader(r_fd)
-            selected = run_picker(
-                CANDIDATES,
-                _identity_filter,
-                _read_char=reader,
-                _write=lambda s: output_buf.append(s),
-            )
-            assert selected == [CANDIDATES[2]]
-        finally:
-            os.close(r_fd)
-            os.close(w_fd)
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, b"\x1b[B\x1b[A")  # ↓ then ↑
+        reader = make_tty_reader(slave_fd)
+        assert _read_key_event(reader, retries=1) == KeyEvent(KEY_DOWN)
+        assert _read_key_event(reader, retries=1) == KeyEvent(KEY_UP)
+
+    def test_run_picker_with_tty_reader(self, pty_fds):
+        """Full picker run using the terminal reader on a real fd."""
+        master_fd, slave_fd = pty_fds
+        os.write(master_fd, b"\x1b[B\x1b[B\r")  # ↓ ↓ Enter
+        output_buf: list[str] = []
+        selected = run_picker(
+            CANDIDATES,
+            _identity_filter,
+            _read_char=make_tty_reader(slave_fd),
+            _write=lambda s: output_buf.append(s),
+        )
+        assert selected == [CANDIDATES[2]]